@@ -3,13 +3,39 @@ Configuration loader with caching and validation.
 Loads persona configurations and validates system setup.
 """
 import json
+import os
 from functools import lru_cache
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from pathlib import Path
 
 from .constants import CONFIG_DIR, PERSONA_MAPPING
 from ..exceptions.errors import ConfigurationError
 
+# Roles whose persona file is named after a different persona
+_PERSONA_ALIASES: Dict[str, str] = {"Developer": "Steve"}
+
+
+@lru_cache(maxsize=128)
+def _read_json(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """
+    Read and parse a JSON config file, memoized on its stat signature.
+
+    The modification time and size are part of the cache key, so an edited
+    file is re-read automatically while unchanged files skip the open and
+    parse entirely. The parsed dict is wrapped read-only because the same
+    object is shared by every caller.
+
+    Args:
+        path: Path to the JSON file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+
+    Returns:
+        Read-only mapping of the parsed JSON object
+    """
+    return MappingProxyType(json.loads(Path(path).read_bytes()))
+
 
 class ConfigLoader:
     """Handles loading and caching of configuration files."""
@@ -42,8 +68,7 @@ class ConfigLoader:
                 f"Configuration path is not a directory: {self._config_dir}"
             )
 
-    @lru_cache(maxsize=10)
-    def load_persona(self, role: str) -> Dict[str, Any]:
+    def load_persona(self, role: str) -> Mapping[str, Any]:
         """
         Load a persona configuration file with caching.
 
@@ -51,22 +76,20 @@ class ConfigLoader:
             role: The role name (Architect, Planner, Developer, QA)
 
         Returns:
-            Dictionary containing persona configuration
+            Read-only mapping containing persona configuration
 
         Raises:
             ConfigurationError: If the persona file cannot be loaded
         """
-        # Handle special case: Developer role uses Steve.json
-        if role == "Developer":
-            filename = "Steve.json"
-        else:
-            filename = PERSONA_MAPPING.get(role, f"{role}.json")
+        # Resolve aliases (Developer role uses Steve.json)
+        persona = _PERSONA_ALIASES.get(role, role)
+        filename = PERSONA_MAPPING.get(persona, f"{persona}.json")
 
         file_path = self._config_dir / filename
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                persona_data = json.load(f)
+            stat = os.stat(file_path)
+            persona_data = _read_json(str(file_path), stat.st_mtime_ns, stat.st_size)
 
             # Validate required fields
             self._validate_persona(persona_data, role)
@@ -85,7 +108,7 @@ class ConfigLoader:
                 f"Failed to load persona {role}: {e}"
             )
 
-    def _validate_persona(self, persona_data: Dict[str, Any], role: str) -> None:
+    def _validate_persona(self, persona_data: Mapping[str, Any], role: str) -> None:
         """
         Validate that a persona has required fields.
 
@@ -104,21 +127,23 @@ class ConfigLoader:
                 f"Persona '{role}' missing required fields: {missing_fields}"
             )
 
-    def reload_persona(self, role: str) -> Dict[str, Any]:
+    def reload_persona(self, role: str) -> Mapping[str, Any]:
         """
         Force reload a persona configuration, bypassing cache.
 
+        Edited files are normally picked up through their modification time;
+        this also covers rewrites that leave the mtime and size unchanged.
+
         Args:
             role: The role name to reload
 
         Returns:
             Updated persona configuration
         """
-        # Clear the cache for this specific role
-        self.load_persona.cache_clear()
+        _read_json.cache_clear()
         return self.load_persona(role)
 
-    def get_all_personas(self) -> Dict[str, Dict[str, Any]]:
+    def get_all_personas(self) -> Dict[str, Mapping[str, Any]]:
         """
         Load all available persona configurations.
 
@@ -51,6 +51,7 @@ STOP_TOKENS = [
 # --- PSI CONFIGURATION ---
 PSI_CACHE_TIMEOUT = 300  # Cache PSI for 5 minutes
 PSI_MAX_FILES = 100  # Summarize if project has more files
+PSI_CACHE_MAX_PROJECTS = 32  # Evict least recently used PSIs beyond this
 
 # --- LOGGING ---
 _raw_log_level = os.getenv("OMNISOLVE_LOG_LEVEL", "INFO").upper()
@@ -119,8 +119,7 @@ class SessionManager:
             return None
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json.loads(path.read_bytes())
             return SessionState(**data)
         except (json.JSONDecodeError, TypeError, KeyError):
             # Corrupted file — treat as no session
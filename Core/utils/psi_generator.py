@@ -4,23 +4,57 @@ Generates directory trees representing current project state.
 """
 import os
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 
-from ..config.constants import PROJECTS_DIR, PSI_CACHE_TIMEOUT, PSI_MAX_FILES
+from ..config import constants
+from ..config.constants import PSI_CACHE_MAX_PROJECTS, PSI_CACHE_TIMEOUT, PSI_MAX_FILES
 from ..exceptions.errors import ProjectError
 from ..logging import get_logger
 
 logger = get_logger('psi')
 
+# Common directories that shouldn't be in PSI (never entered while walking)
+_EXCLUDED_DIRS = frozenset({
+    '__pycache__', '.git', '.venv', 'node_modules',
+    'venv', '.pytest_cache', '.mypy_cache'
+})
+
+# Directory listings are only reused when the directory's mtime is older than
+# this, since a change within the same timestamp tick would not alter the mtime.
+_LISTING_SETTLE_NS = 2_000_000_000
+
+# dir path -> (mtime_ns, sorted (name, path) of subdirectories, sorted file names);
+# mtime_ns is None for listings taken inside the settle window, which are kept
+# only so that vanished subdirectories can be pruned on the next scan
+_DirListings = Dict[str, Tuple[Optional[int], List[Tuple[str, str]], List[str]]]
+
+
+def _forget_dir(listings: _DirListings, dir_path: str) -> None:
+    """
+    Drop the cached listing of a directory and of everything below it.
+
+    Args:
+        listings: Cached listings for the project
+        dir_path: Directory that no longer exists or can no longer be read
+    """
+    stack = [dir_path]
+    while stack:
+        entry = listings.pop(stack.pop(), None)
+        if entry is not None:
+            stack.extend(path for _, path in entry[1])
+
 
 class PSIGenerator:
     """Generates and caches Project State Interface representations."""
 
     def __init__(self):
         """Initialize the PSI generator."""
-        self._cache: Dict[str, tuple[str, float]] = {}  # project_name -> (psi, timestamp)
-        self._projects_dir = Path(PROJECTS_DIR)
+        # project_name -> (psi, timestamp), least recently used first
+        self._cache: 'OrderedDict[str, Tuple[str, float]]' = OrderedDict()
+        self._listings: Dict[str, _DirListings] = {}  # project_name -> directory listings
+        self._projects_dir = Path(constants.PROJECTS_DIR)  # Read at construction so it can be overridden
 
         # Ensure projects directory exists
         self._projects_dir.mkdir(exist_ok=True, parents=True)
@@ -52,6 +86,7 @@ class PSIGenerator:
 
             if age < PSI_CACHE_TIMEOUT:
                 logger.debug(f"Using cached PSI for {project_name} (age: {age:.1f}s)")
+                self._cache.move_to_end(project_name)
                 return cached_psi
             else:
                 logger.debug(f"Cache expired for {project_name} (age: {age:.1f}s)")
@@ -63,12 +98,22 @@ class PSIGenerator:
         if not project_path.exists():
             logger.info(f"New project: {project_name}")
             psi = f"PROJECT STATE: New Project (Empty Directory)\nPath: {project_path}"
+            self._listings.pop(project_name, None)
         else:
             logger.debug(f"Generating PSI for existing project: {project_name}")
-            psi = self._generate_tree(project_path, project_name, max_depth)
+            # Listings are only kept for projects whose walk succeeded, so every
+            # entry in _listings has a matching _cache entry to be evicted with
+            listings = self._listings.get(project_name, {})
+            psi = self._generate_tree(project_path, project_name, listings, max_depth)
+            self._listings[project_name] = listings
 
-        # Cache the result
+        # Cache the result, evicting the least recently used projects
         self._cache[project_name] = (psi, time.time())
+        self._cache.move_to_end(project_name)
+        while len(self._cache) > PSI_CACHE_MAX_PROJECTS:
+            evicted, _ = self._cache.popitem(last=False)
+            self._listings.pop(evicted, None)
+            logger.debug(f"Evicted PSI cache for {evicted}")
 
         return psi
 
@@ -76,6 +121,7 @@ class PSIGenerator:
         self,
         project_path: Path,
         project_name: str,
+        listings: _DirListings,
         max_depth: Optional[int] = None
     ) -> str:
         """
@@ -84,58 +130,49 @@ class PSIGenerator:
         Args:
             project_path: Path to the project directory
             project_name: Name of the project
+            listings: Cached directory listings to reuse and update
             max_depth: Maximum depth to traverse
 
         Returns:
             Tree representation as string
         """
-        psi = f"PROJECT STATE ({project_name}):\n"
-        psi += f"Location: {project_path}\n\n"
+        lines = [f"PROJECT STATE ({project_name}):", f"Location: {project_path}", ""]
 
         file_count = 0
         dir_count = 0
+        root = str(project_path)
 
         try:
-            for root, dirs, files in os.walk(project_path):
-                # Calculate current depth
-                level = root.replace(str(project_path), '').count(os.sep)
+            # Depth-first, pre-order walk (same order as os.walk top-down)
+            stack = [(project_path.name, root, 0)]
+            while stack:
+                dir_name, dir_path, level = stack.pop()
 
                 # Check depth limit
                 if max_depth is not None and level >= max_depth:
-                    dirs[:] = []  # Don't recurse deeper
                     continue
 
-                # Skip common directories that shouldn't be in PSI
-                dirs[:] = [d for d in dirs if d not in [
-                    '__pycache__', '.git', '.venv', 'node_modules',
-                    'venv', '.pytest_cache', '.mypy_cache'
-                ]]
-
-                indent = '  ' * level
-                dir_name = os.path.basename(root)
-
-                if level == 0:
-                    psi += f"{dir_name}/\n"
-                else:
-                    psi += f"{indent}{dir_name}/\n"
+                try:
+                    dirs, files = self._list_dir(listings, dir_path)
+                except OSError:
+                    if dir_path == root:
+                        raise
+                    _forget_dir(listings, dir_path)
+                    continue  # Unreadable subdirectory: skip it like os.walk does
 
                 dir_count += len(dirs)
+                stack.extend((name, path, level + 1) for name, path in reversed(dirs))
 
-                # Add files
-                for file in sorted(files):
-                    psi += f"{indent}  {file}\n"
-                    file_count += 1
+                file_count = self._add_dir_lines(lines, dir_name, level, files, file_count)
+                if file_count > PSI_MAX_FILES:
+                    logger.warning(
+                        f"Project {project_name} has {file_count} files, "
+                        f"truncating PSI at {PSI_MAX_FILES}"
+                    )
+                    lines += ["", f"Summary: {dir_count} directories, {file_count}+ files"]
+                    return '\n'.join(lines)
 
-                    # If too many files, summarize instead
-                    if file_count > PSI_MAX_FILES:
-                        psi += f"{indent}  ... ({file_count - PSI_MAX_FILES} more files)\n"
-                        logger.warning(
-                            f"Project {project_name} has {file_count} files, "
-                            f"truncating PSI at {PSI_MAX_FILES}"
-                        )
-                        return psi + f"\nSummary: {dir_count} directories, {file_count}+ files"
-
-            psi += f"\nSummary: {dir_count} directories, {file_count} files"
+            lines += ["", f"Summary: {dir_count} directories, {file_count} files"]
 
         except PermissionError as e:
             logger.error(f"Permission denied accessing {project_path}: {e}")
@@ -144,7 +181,84 @@ class PSIGenerator:
             logger.error(f"Error generating PSI for {project_name}: {e}")
             raise ProjectError(f"Failed to generate PSI for {project_name}", {'error': str(e)})
 
-        return psi
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _add_dir_lines(lines: List[str], dir_name: str, level: int, files: List[str], file_count: int) -> int:
+        """
+        Append one directory and its files to the tree.
+
+        Stops after the file that takes the total past PSI_MAX_FILES and
+        appends a "more files" marker instead of the rest.
+
+        Args:
+            lines: Tree lines to extend
+            dir_name: Name of the directory
+            level: Depth of the directory below the project root
+            files: Sorted file names in the directory
+            file_count: Files listed so far
+
+        Returns:
+            Updated file count
+        """
+        indent = '  ' * level
+        lines.append(f"{indent}{dir_name}/")
+
+        for file in files:
+            lines.append(f"{indent}  {file}")
+            file_count += 1
+
+            # If too many files, summarize instead
+            if file_count > PSI_MAX_FILES:
+                lines.append(f"{indent}  ... ({file_count - PSI_MAX_FILES} more files)")
+                break
+
+        return file_count
+
+    def _list_dir(self, listings: _DirListings, dir_path: str) -> Tuple[List[Tuple[str, str]], List[str]]:
+        """
+        List a directory's subdirectories and files.
+
+        A cached listing is reused while the directory's mtime is unchanged, so
+        regenerating an unchanged tree costs one stat() per directory. When a
+        directory is rescanned, cached listings of subdirectories that are no
+        longer present are dropped.
+
+        Args:
+            listings: Cached listings for the project
+            dir_path: Directory to list
+
+        Returns:
+            Tuple of (sorted (name, path) pairs of subdirectories, sorted file names)
+        """
+        mtime_ns = os.stat(dir_path).st_mtime_ns
+        cached = listings.get(dir_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+        dirs = []
+        files = []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                # is_dir() without following symlinks uses the d_type from the
+                # directory read, so no per-entry stat() is needed
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _EXCLUDED_DIRS:
+                        dirs.append((entry.name, entry.path))
+                else:
+                    files.append(entry.name)
+        dirs.sort()
+        files.sort()
+
+        if cached is not None:
+            listed = {path for _, path in dirs}
+            for _, path in cached[1]:
+                if path not in listed:
+                    _forget_dir(listings, path)
+
+        settled = time.time_ns() - mtime_ns >= _LISTING_SETTLE_NS
+        listings[dir_path] = (mtime_ns if settled else None, dirs, files)
+        return dirs, files
 
     def invalidate_cache(self, project_name: Optional[str] = None) -> None:
         """
@@ -156,9 +270,11 @@ class PSIGenerator:
         if project_name is None:
             logger.debug("Invalidating all PSI cache")
             self._cache.clear()
-        elif project_name in self._cache:
-            logger.debug(f"Invalidating PSI cache for {project_name}")
-            del self._cache[project_name]
+            self._listings.clear()
+        else:
+            self._listings.pop(project_name, None)
+            if self._cache.pop(project_name, None) is not None:
+                logger.debug(f"Invalidating PSI cache for {project_name}")
 
     def get_cache_stats(self) -> dict:
         """
@@ -167,9 +283,12 @@ class PSIGenerator:
         Returns:
             Dictionary with cache statistics
         """
+        projects = list(self._cache)
         return {
-            'cached_projects': len(self._cache),
-            'projects': list(self._cache.keys())
+            'cached_projects': projects,
+            'cache_size': len(projects),
+            'max_size': PSI_CACHE_MAX_PROJECTS,
+            'projects': projects
         }
 
 
@@ -4,7 +4,8 @@ Handles extraction of JSON and code from LLM outputs.
 """
 import json
 import re
-from typing import Optional, List
+from functools import lru_cache
+from typing import Iterator, Optional, List, Tuple
 from ..logging import get_logger
 
 logger = get_logger('parsers')
@@ -12,11 +13,25 @@ logger = get_logger('parsers')
 # Pre-compiled regex patterns for efficiency
 CODE_BLOCK_PATTERN = re.compile(r"```(?:python)?\s*(.*?)```", re.DOTALL)
 COMMENT_PATTERN = re.compile(r'^\s*#', re.MULTILINE)
+FILE_PATH_PATTERN = re.compile(r'(?:^|\s)([a-zA-Z0-9_\-./\\]+\.[a-zA-Z0-9]+)(?:\s|$|,|;)', re.MULTILINE)
+
+# Shared decoder for extracting a JSON value embedded in free text
+_JSON_DECODER = json.JSONDecoder()
+
+# Common system markers removed by clean_response
+SYSTEM_MARKERS = (
+    "SYSTEM ROLE:",
+    "[CURRENT TASK]",
+    "[END]",
+    "RESPONSE:",
+    "USER:",
+    "ASSISTANT:"
+)
 
 
 def extract_json(text: str) -> Optional[List[dict]]:
     """
-    Extract JSON list from text using bracket counting.
+    Extract JSON list from text, starting at the first '['.
     Robust against chatty explanations after the JSON.
     
     Args:
@@ -28,39 +43,22 @@ def extract_json(text: str) -> Optional[List[dict]]:
     Raises:
         ParsingError: If JSON is malformed
     """
-    text = text.strip()
     start_index = text.find('[')
     
     if start_index == -1:
         logger.debug("No JSON list found in text")
         return None
     
-    # Scan forward from the first '['
-    bracket_count = 0
-    for i, char in enumerate(text[start_index:], start_index):
-        if char == '[':
-            bracket_count += 1
-        elif char == ']':
-            bracket_count -= 1
-        
-        # If brackets are balanced (count is 0) and we found at least one pair
-        if bracket_count == 0:
-            json_candidate = text[start_index:i+1]
-            try:
-                parsed = json.loads(json_candidate)
-                if isinstance(parsed, list):
-                    logger.debug(f"Successfully extracted JSON list with {len(parsed)} items")
-                    return parsed
-                else:
-                    logger.warning("Extracted JSON is not a list")
-                    return None
-            except json.JSONDecodeError as e:
-                # Maybe we stopped too early (nested brackets?), continue searching
-                logger.debug(f"JSON decode failed at position {i}: {e}")
-                continue
-    
-    logger.warning("Could not find valid JSON list in text")
-    return None
+    # raw_decode parses exactly one value from the offset and ignores any
+    # trailing text, so brackets inside strings need no special handling
+    try:
+        parsed, _ = _JSON_DECODER.raw_decode(text, start_index)
+    except json.JSONDecodeError as e:
+        logger.warning(f"Could not find valid JSON list in text: {e}")
+        return None
+    
+    logger.debug(f"Successfully extracted JSON list with {len(parsed)} items")
+    return parsed
 
 
 def extract_json_any(text: str) -> Optional[object]:
@@ -68,39 +66,21 @@ def extract_json_any(text: str) -> Optional[object]:
     Extract the first JSON value (object or array) from text.
     Returns the parsed JSON (dict or list), or None if none found.
     """
-    text = text.strip()
-    # Look for either '{' or '['
-    idx_obj = text.find('{') if '{' in text else -1
-    idx_arr = text.find('[') if '[' in text else -1
+    idx_obj = text.find('{')
+    idx_arr = text.find('[')
     if idx_obj == -1 and idx_arr == -1:
         logger.debug("No JSON object or array found in text")
         return None
 
-    start_index = min([i for i in (idx_obj, idx_arr) if i != -1])
-    opening = text[start_index]
-    if opening == '{':
-        open_ch, close_ch = '{', '}'
-    else:
-        open_ch, close_ch = '[', ']'
-
-    depth = 0
-    for i, ch in enumerate(text[start_index:], start_index):
-        if ch == open_ch:
-            depth += 1
-        elif ch == close_ch:
-            depth -= 1
-        if depth == 0:
-            candidate = text[start_index:i+1]
-            try:
-                parsed = json.loads(candidate)
-                logger.debug("Successfully extracted JSON value")
-                return parsed
-            except json.JSONDecodeError as e:
-                logger.debug(f"JSON decode failed at position {i}: {e}")
-                continue
-
-    logger.debug("Could not extract any JSON value")
-    return None
+    start_index = min(i for i in (idx_obj, idx_arr) if i != -1)
+    try:
+        parsed, _ = _JSON_DECODER.raw_decode(text, start_index)
+    except json.JSONDecodeError as e:
+        logger.debug(f"Could not extract any JSON value: {e}")
+        return None
+
+    logger.debug("Successfully extracted JSON value")
+    return parsed
 
 
 def extract_code(text: str, validate_non_empty: bool = True) -> Optional[str]:
@@ -115,9 +95,7 @@ def extract_code(text: str, validate_non_empty: bool = True) -> Optional[str]:
     Returns:
         Extracted code or None if not found/invalid
     """
-    matches = CODE_BLOCK_PATTERN.findall(text)
-    
-    for block in matches:
+    for block in _iter_code_blocks(text):
         if not validate_non_empty:
             return block
         
@@ -148,7 +126,32 @@ def extract_code_blocks(text: str) -> List[str]:
     Returns:
         List of all code blocks found
     """
-    return CODE_BLOCK_PATTERN.findall(text)
+    return list(_iter_code_blocks(text))
+
+
+def _iter_code_blocks(text: str) -> Iterator[str]:
+    """
+    Yield code blocks lazily, matching the same blocks as CODE_BLOCK_PATTERN.
+    
+    Plain substring searches are several times faster than the lazy DOTALL
+    regex on long responses, and callers can stop at the first usable block.
+    
+    Args:
+        text: Text containing code blocks
+        
+    Yields:
+        Block contents without the fence, language tag or leading whitespace
+    """
+    fence = text.find('```')
+    while fence != -1:
+        start = fence + 3
+        if text.startswith('python', start):
+            start += 6
+        end = text.find('```', start)
+        if end == -1:
+            return
+        yield text[start:end].lstrip()
+        fence = text.find('```', end + 3)
 
 
 def validate_python_syntax(code: str) -> tuple[bool, Optional[str]]:
@@ -161,17 +164,40 @@ def validate_python_syntax(code: str) -> tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    issue = _check_syntax(code)
+    if issue is None:
+        return True, None
+    is_syntax_error, lineno, message = issue
+    if is_syntax_error:
+        error_msg = f"Syntax error at line {lineno}: {message}"
+    else:
+        error_msg = f"Validation error: {message}"
+    logger.warning(f"Code validation failed: {error_msg}")
+    return False, error_msg
+
+
+@lru_cache(maxsize=256)
+def _check_syntax(code: str) -> Optional[Tuple[bool, Optional[int], str]]:
+    """
+    Compile code once per distinct source and return the problem, if any.
+    
+    Shared by validate_python_syntax and validate_developer_output, which
+    format the result differently but use one compile path and one cache.
+    
+    Args:
+        code: Python code to compile
+        
+    Returns:
+        None if the code compiles, otherwise a tuple of
+        (is_syntax_error, line_number, message)
+    """
     try:
         compile(code, '<string>', 'exec')
-        return True, None
+        return None
     except SyntaxError as e:
-        error_msg = f"Syntax error at line {e.lineno}: {e.msg}"
-        logger.warning(f"Code validation failed: {error_msg}")
-        return False, error_msg
+        return True, e.lineno, e.msg
     except Exception as e:
-        error_msg = f"Validation error: {str(e)}"
-        logger.warning(error_msg)
-        return False, error_msg
+        return False, None, str(e)
 
 
 def clean_response(text: str, remove_system_prompts: bool = True) -> str:
@@ -188,18 +214,12 @@ def clean_response(text: str, remove_system_prompts: bool = True) -> str:
     text = text.strip()
     
     if remove_system_prompts:
-        # Remove common system markers
-        markers = [
-            "SYSTEM ROLE:",
-            "[CURRENT TASK]",
-            "[END]",
-            "RESPONSE:",
-            "USER:",
-            "ASSISTANT:"
-        ]
-        for marker in markers:
-            if marker in text:
-                text = text.split(marker)[0].strip()
+        # Truncate at the first occurrence of each marker; slicing avoids
+        # splitting the whole response into parts only to keep the first
+        for marker in SYSTEM_MARKERS:
+            index = text.find(marker)
+            if index != -1:
+                text = text[:index].strip()
     
     return text
 
@@ -214,7 +234,5 @@ def extract_file_paths(text: str) -> List[str]:
     Returns:
         List of extracted file paths
     """
-    # Pattern to match common file path formats
-    pattern = r'(?:^|\s)([a-zA-Z0-9_\-./\\]+\.[a-zA-Z0-9]+)(?:\s|$|,|;)'
-    matches = re.findall(pattern, text, re.MULTILINE)
+    matches = FILE_PATH_PATTERN.findall(text)
     return list(set(matches))  # Remove duplicates
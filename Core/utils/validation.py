@@ -12,9 +12,21 @@ from ..exceptions.errors import (
     ConfigurationError
 )
 from ..logging import get_logger
+from .text_parsers import _check_syntax
 
 logger = get_logger('validation')
 
+# Pre-compiled regex patterns for efficiency
+_PROJECT_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]+\Z')
+_VAGUE_RE = re.compile(r'\b(?:something|thing|stuff|maybe|kind of|sort of)\b', re.IGNORECASE)
+
+# Characters that are not allowed in generated file paths
+_INVALID_PATH_CHARS = frozenset('<>:"|?*')
+
+# Architect file entry schema
+_ARCH_REQUIRED_FIELDS = frozenset({'path', 'type', 'action'})
+_ARCH_VALID_ACTIONS = frozenset({'create', 'modify', 'preserve', 'delete'})
+
 
 def _validate_non_empty_string(value: Any, field_name: str, min_length: int = 0) -> Tuple[List[str], List[str]]:
     """
@@ -36,14 +48,15 @@ def _validate_non_empty_string(value: Any, field_name: str, min_length: int = 0)
         errors.append(f"{field_name} must be a string, got {type(value).__name__}")
         return errors, warnings
     
-    # Check if empty
-    if not value.strip():
+    # Check if empty (strip once; the value may be a whole generated file)
+    stripped_length = len(value.strip())
+    if not stripped_length:
         errors.append(f"{field_name} is empty")
         return errors, warnings
     
     # Check minimum length if specified
-    if min_length > 0 and len(value.strip()) < min_length:
-        warnings.append(f"{field_name} is very short ({len(value.strip())} chars) - may lack detail")
+    if min_length > 0 and stripped_length < min_length:
+        warnings.append(f"{field_name} is very short ({stripped_length} chars) - may lack detail")
     
     return errors, warnings
 
@@ -51,6 +64,9 @@ def _validate_non_empty_string(value: Any, field_name: str, min_length: int = 0)
 class ValidationResult:
     """Result of a validation operation."""
     
+    # One result is created per validated file; slots drop the per-instance __dict__
+    __slots__ = ('valid', 'errors', 'warnings')
+    
     def __init__(self, valid: bool, errors: Optional[List[str]] = None, warnings: Optional[List[str]] = None):
         """
         Initialize validation result.
@@ -76,6 +92,32 @@ class ValidationResult:
             return "Valid"
         return f"Invalid: {len(self.errors)} errors"
     
+    def has_error(self, keyword: str) -> bool:
+        """
+        Check whether any error message mentions a keyword, ignoring case.
+        
+        Args:
+            keyword: Text to look for
+            
+        Returns:
+            True if an error contains the keyword
+        """
+        keyword = keyword.lower()
+        return any(keyword in error.lower() for error in self.errors)
+    
+    def has_warning(self, keyword: str) -> bool:
+        """
+        Check whether any warning message mentions a keyword, ignoring case.
+        
+        Args:
+            keyword: Text to look for
+            
+        Returns:
+            True if a warning contains the keyword
+        """
+        keyword = keyword.lower()
+        return any(keyword in warning.lower() for warning in self.warnings)
+    
     def get_summary(self) -> str:
         """Get detailed summary of validation result."""
         parts = []
@@ -113,46 +155,43 @@ def validate_architect_output(file_list: Any) -> ValidationResult:
         warnings.append("File list is empty - no files to generate")
     
     # Validate each file entry
-    required_fields = {'path', 'type', 'action'}
-    valid_actions = {'create', 'modify', 'preserve', 'delete'}
-    
-    for i, file_entry in enumerate(file_list):
-        entry_prefix = f"File entry {i + 1}"
+    for entry_no, file_entry in enumerate(file_list, 1):
+        # Messages are prefixed with f"File entry {entry_no}" only when an issue is
+        # found, so well-formed entries do no string formatting at all.
         
         # Check if it's a dictionary
         if not isinstance(file_entry, dict):
-            errors.append(f"{entry_prefix}: Expected dict but got {type(file_entry).__name__}")
+            errors.append(f"File entry {entry_no}: Expected dict but got {type(file_entry).__name__}")
             continue
         
-        # Check required fields
-        missing_fields = required_fields - set(file_entry.keys())
-        if missing_fields:
-            errors.append(f"{entry_prefix}: Missing required fields: {', '.join(missing_fields)}")
+        # Check required fields; the remaining checks assume they are present.
+        # The keys-view comparison allocates nothing when all fields exist.
+        if not file_entry.keys() >= _ARCH_REQUIRED_FIELDS:
+            missing_fields = _ARCH_REQUIRED_FIELDS.difference(file_entry)
+            errors.append(f"File entry {entry_no}: Missing required fields: {', '.join(sorted(missing_fields))}")
+            continue
         
         # Validate path
-        if 'path' in file_entry:
-            path = file_entry['path']
-            if not path or not isinstance(path, str):
-                errors.append(f"{entry_prefix}: Invalid path (must be non-empty string)")
-            elif '..' in path:
-                warnings.append(f"{entry_prefix}: Path contains '..' which may be unsafe: {path}")
-            elif path.startswith('/'):
-                warnings.append(f"{entry_prefix}: Absolute path used: {path}")
+        path = file_entry['path']
+        if not path or not isinstance(path, str):
+            errors.append(f"File entry {entry_no}: Invalid path (must be non-empty string)")
+        elif '..' in path:
+            warnings.append(f"File entry {entry_no}: Path contains '..' which may be unsafe: {path}")
+        elif path.startswith('/'):
+            warnings.append(f"File entry {entry_no}: Absolute path used: {path}")
         
         # Validate action
-        if 'action' in file_entry:
-            action = file_entry['action']
-            if action not in valid_actions:
-                errors.append(
-                    f"{entry_prefix}: Invalid action '{action}'. "
-                    f"Must be one of: {', '.join(valid_actions)}"
-                )
+        action = file_entry['action']
+        if not isinstance(action, str) or action not in _ARCH_VALID_ACTIONS:
+            errors.append(
+                f"File entry {entry_no}: Invalid action '{action}'. "
+                f"Must be one of: {', '.join(sorted(_ARCH_VALID_ACTIONS))}"
+            )
         
         # Validate type
-        if 'type' in file_entry:
-            file_type = file_entry['type']
-            if not file_type or not isinstance(file_type, str):
-                warnings.append(f"{entry_prefix}: File type should be a non-empty string")
+        file_type = file_entry['type']
+        if not file_type or not isinstance(file_type, str):
+            warnings.append(f"File entry {entry_no}: File type should be a non-empty string")
     
     is_valid = len(errors) == 0
     return ValidationResult(is_valid, errors, warnings)
@@ -202,25 +241,24 @@ def validate_developer_output(code: Any, file_path: Optional[str] = None) -> Val
     
     # Python-specific validation (if file_path suggests Python)
     if file_path and file_path.endswith('.py'):
-        # Check for common Python issues
-        if 'import ' not in code and 'from ' not in code and len(code) > 100:
+        # Check for common Python issues (length first so short code is never scanned)
+        if len(code) > 100 and 'import ' not in code and 'from ' not in code:
             warnings.append("No import statements found - code may be incomplete")
         
         # Check for basic structure
-        if 'def ' not in code and 'class ' not in code and len(code) > 50:
+        if len(code) > 50 and 'def ' not in code and 'class ' not in code:
             warnings.append("No functions or classes defined - may be incomplete")
         
-        # Check indentation issues (basic)
-        lines = code.split('\n')
-        for i, line in enumerate(lines, 1):
-            if line and not line[0].isspace() and line[0] != '#':
-                # Check if line after def/class is indented
-                if i < len(lines):
-                    prev_line = lines[i - 1].strip()
-                    if prev_line.endswith(':'):
-                        next_line = lines[i] if i < len(lines) else ''
-                        if next_line and not next_line[0].isspace():
-                            warnings.append(f"Line {i + 1}: Expected indentation after '{prev_line}'")
+        # Check syntax (covers indentation issues) with the real parser, through
+        # the same memoized helper that backs validate_python_syntax
+        issue = _check_syntax(code)
+        if issue is not None:
+            is_syntax_error, lineno, message = issue
+            if is_syntax_error:
+                warnings.append(f"Line {lineno}: {message}")
+            else:
+                # e.g. ValueError for null bytes on older Python versions
+                warnings.append(f"Code cannot be parsed: {message}")
     
     is_valid = len(errors) == 0
     return ValidationResult(is_valid, errors, warnings)
@@ -249,9 +287,7 @@ def validate_task_description(task: str) -> ValidationResult:
         warnings.append("Task is phrased as a question - rephrase as a directive for better results")
     
     # Check for vague language
-    vague_terms = ['something', 'thing', 'stuff', 'maybe', 'kind of', 'sort of']
-    task_lower = task.lower()
-    found_vague = [term for term in vague_terms if term in task_lower]
+    found_vague = list(dict.fromkeys(term.lower() for term in _VAGUE_RE.findall(task)))
     if found_vague:
         warnings.append(f"Task contains vague language: {', '.join(found_vague)} - be more specific")
     
@@ -273,8 +309,13 @@ def validate_project_name(project_name: str) -> ValidationResult:
     if errors:
         return ValidationResult(False, errors)
     
+    # Fast path: an ASCII identifier of reasonable length passes every check
+    # below (no hyphen, space or leading digit) without a regex match
+    if project_name.isascii() and project_name.isidentifier() and 3 <= len(project_name) <= 50:
+        return ValidationResult(True)
+    
     # Check for invalid characters
-    if not re.match(r'^[a-zA-Z0-9_-]+$', project_name):
+    if not _PROJECT_NAME_RE.match(project_name):
         errors.append(
             "Project name contains invalid characters. "
             "Use only letters, numbers, underscores, and hyphens."
@@ -363,14 +404,15 @@ def validate_file_path(file_path: str, project_root: Optional[Path] = None) -> V
     if file_path.startswith('/') or (len(file_path) > 1 and file_path[1] == ':'):
         errors.append("File path is absolute - only relative paths are allowed")
     
-    # Check for invalid characters
-    invalid_chars = ['<', '>', ':', '"', '|', '?', '*']
-    found_invalid = [char for char in invalid_chars if char in file_path]
-    if found_invalid:
-        errors.append(f"File path contains invalid characters: {', '.join(found_invalid)}")
+    # Check for invalid characters (isdisjoint stops early and builds no set;
+    # the offending characters are only collected for the error message)
+    if not _INVALID_PATH_CHARS.isdisjoint(file_path):
+        found_invalid = _INVALID_PATH_CHARS.intersection(file_path)
+        errors.append(f"File path contains invalid characters: {', '.join(sorted(found_invalid))}")
     
-    # Check file extension
-    if '.' not in Path(file_path).name:
+    # Check file extension (on the last path component, either separator style)
+    basename = file_path[max(file_path.rfind('/'), file_path.rfind('\\')) + 1:]
+    if '.' not in basename:
         warnings.append("File has no extension - may cause issues")
     
     is_valid = len(errors) == 0
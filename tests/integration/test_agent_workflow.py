@@ -249,4 +249,4 @@ class TestEndToEndWorkflow:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    raise SystemExit(pytest.main([__file__, "-v"]))
@@ -7,7 +7,7 @@ import json
 import os
 import tempfile
 import shutil
-from Core.config.config_loader import ConfigLoader
+from Core.config.config_loader import ConfigLoader, _read_json
 
 
 class TestConfigLoader:
@@ -282,5 +282,87 @@ class TestConfigLoaderEdgeCases:
             shutil.rmtree(temp_dir)
 
 
+class TestSharedPersonas:
+    """Tests for personas shared between agents via the default config directory."""
+
+    def test_repeated_loads_share_one_object(self):
+        """Test repeated loads return the same cached mapping."""
+        loader = ConfigLoader()
+        assert loader.load_persona("Architect") is loader.load_persona("Architect")
+
+    def test_persona_is_read_only(self):
+        """Test a shared persona cannot be mutated by one of its users."""
+        persona = ConfigLoader().load_persona("QA")
+        with pytest.raises(TypeError):
+            persona["name"] = "Mutated"
+        assert ConfigLoader().load_persona("QA")["name"] != "Mutated"
+
+    def test_persona_supports_dict_style_access(self):
+        """Test read-only personas still behave like dicts for readers."""
+        persona = ConfigLoader().load_persona("Planner")
+        assert persona.get("missing", "default") == "default"
+        assert dict(persona)["name"] == persona["name"]
+
+    def test_developer_alias(self):
+        """Test the Developer role resolves to the Steve persona file."""
+        loader = ConfigLoader()
+        assert loader.load_persona("Developer") is loader.load_persona("Steve")
+
+
+class TestReadJson:
+    """Tests for the stat-keyed JSON file cache."""
+
+    @pytest.fixture
+    def persona_file(self, tmp_path):
+        """Write a small persona file and clear the cache around the test."""
+        _read_json.cache_clear()
+        path = tmp_path / "Cached.json"
+        path.write_text(json.dumps({"name": "Cached", "role": "test"}), encoding="utf-8")
+        yield path
+        _read_json.cache_clear()
+
+    @staticmethod
+    def _read(path):
+        stat = os.stat(path)
+        return _read_json(str(path), stat.st_mtime_ns, stat.st_size)
+
+    def test_unchanged_file_is_cached(self, persona_file):
+        """Test repeated reads of an unchanged file return the same object."""
+        assert self._read(persona_file) is self._read(persona_file)
+        assert _read_json.cache_info().hits == 1
+
+    def test_modified_file_is_reread(self, persona_file):
+        """Test a change in mtime/size invalidates the cached entry."""
+        first = self._read(persona_file)
+        persona_file.write_text(json.dumps({"name": "Changed", "role": "test"}), encoding="utf-8")
+        stat = os.stat(persona_file)
+        os.utime(persona_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = self._read(persona_file)
+        assert first["name"] == "Cached"
+        assert second["name"] == "Changed"
+
+    def test_invalid_json_raises_decode_error(self, persona_file):
+        """Test malformed JSON raises json.JSONDecodeError."""
+        persona_file.write_text("{ invalid json }", encoding="utf-8")
+        with pytest.raises(json.JSONDecodeError):
+            self._read(persona_file)
+
+    def test_unicode_content(self, persona_file):
+        """Test UTF-8 content is decoded from the raw bytes."""
+        persona_file.write_text(json.dumps({"name": "测试 🎉"}, ensure_ascii=False), encoding="utf-8")
+        assert self._read(persona_file)["name"] == "测试 🎉"
+
+    def test_utf8_bom_accepted(self, persona_file):
+        """Test files saved with a UTF-8 BOM (common on Windows) still parse."""
+        persona_file.write_bytes(b"\xef\xbb\xbf" + json.dumps({"name": "Bom"}).encode("utf-8"))
+        assert self._read(persona_file)["name"] == "Bom"
+
+    def test_result_is_read_only(self, persona_file):
+        """Test the shared cached mapping cannot be mutated."""
+        with pytest.raises(TypeError):
+            self._read(persona_file)["name"] = "Mutated"
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    raise SystemExit(pytest.main([__file__, "-v"]))
@@ -130,15 +130,16 @@ class TestPSIGenerator:
         # Invalidate cache
         psi_gen.invalidate_cache(project_name)
         
-        # Modify file
-        with open(os.path.join(project_path, "test.py"), "a") as f:
-            f.write("\n# Modified")
+        # Add a file (the PSI lists names only, so content edits don't show)
+        with open(os.path.join(project_path, "added.py"), "w") as f:
+            f.write("# Added")
         
-        # Generate again - should reflect changes
-        psi2 = psi_gen.generate_psi(project_name, use_cache=False)
+        # Generate again with the cache enabled - should reflect changes
+        psi2 = psi_gen.generate_psi(project_name, use_cache=True)
         
-        # PSIs should differ since file changed
+        # PSIs should differ since the tree changed
         assert psi1 != psi2
+        assert "added.py" in psi2
 
     def test_psi_filters_pycache(self, psi_gen, temp_projects_dir):
         """Test that __pycache__ directories are filtered out."""
@@ -201,6 +202,37 @@ class TestPSIGenerator:
         assert 'cache_size' in stats
         assert project_name in stats['cached_projects']
 
+    def test_psi_filters_virtualenv_and_tool_caches(self, psi_gen, temp_projects_dir):
+        """Test that virtualenv and tool cache directories are filtered out."""
+        project_name = "test_tool_dirs"
+        project_path = os.path.join(temp_projects_dir, project_name)
+        for name in (".venv", "venv", ".pytest_cache", ".mypy_cache"):
+            os.makedirs(os.path.join(project_path, name))
+            with open(os.path.join(project_path, name, "marker.txt"), "w") as f:
+                f.write("x")
+        with open(os.path.join(project_path, "main.py"), "w") as f:
+            f.write("# Main")
+
+        psi = psi_gen.generate_psi(project_name, use_cache=False)
+
+        assert "main.py" in psi
+        assert "marker.txt" not in psi
+        assert "Summary: 0 directories, 1 files" in psi
+
+    def test_cache_evicts_least_recently_used(self, psi_gen, monkeypatch):
+        """Test the PSI cache is bounded and evicts the least recently used project."""
+        import sys
+        monkeypatch.setattr(sys.modules["Core.utils.psi_generator"], "PSI_CACHE_MAX_PROJECTS", 2)
+
+        psi_gen.generate_psi("project_a")
+        psi_gen.generate_psi("project_b")
+        psi_gen.generate_psi("project_a")  # Cache hit marks project_a as recently used
+        psi_gen.generate_psi("project_c")
+
+        stats = psi_gen.get_cache_stats()
+        assert stats['cached_projects'] == ["project_a", "project_c"]
+        assert stats['cache_size'] == 2
+
     def test_psi_with_special_characters_in_filenames(self, psi_gen, temp_projects_dir):
         """Test PSI handles files with special characters."""
         project_name = "test_special"
@@ -230,14 +262,15 @@ class TestPSIGenerator:
         # First call with cache disabled
         psi1 = psi_gen.generate_psi(project_name, use_cache=False)
         
-        # Modify file
-        with open(os.path.join(project_path, "test.py"), "w") as f:
-            f.write("# Modified")
+        # Add a file (the PSI lists names only, so content edits don't show)
+        with open(os.path.join(project_path, "added.py"), "w") as f:
+            f.write("# Added")
         
         # Call again with cache disabled - should see changes
         psi2 = psi_gen.generate_psi(project_name, use_cache=False)
         
         assert psi1 != psi2
+        assert "added.py" in psi2
 
     def test_psi_with_multiple_file_types(self, psi_gen, temp_projects_dir):
         """Test PSI includes various file types."""
@@ -262,6 +295,100 @@ class TestPSIGenerator:
         for filename in files.keys():
             assert filename in psi
 
+    def test_unchanged_directories_are_not_rescanned(self, psi_gen, temp_projects_dir):
+        """Test settled directory listings are reused instead of rescanned."""
+        project_name = "test_listing_cache"
+        project_path = os.path.join(temp_projects_dir, project_name)
+        os.makedirs(os.path.join(project_path, "src"))
+        with open(os.path.join(project_path, "src", "app.py"), "w") as f:
+            f.write("# App")
+        for path in (project_path, os.path.join(project_path, "src")):
+            os.utime(path, (0, 0))  # Old mtime: listing is safe to cache
+
+        psi1 = psi_gen.generate_psi(project_name, use_cache=False)
+        with patch("os.scandir", side_effect=AssertionError("rescanned")):
+            psi2 = psi_gen.generate_psi(project_name, use_cache=False)
+
+        assert psi1 == psi2
+
+    def test_changed_directory_is_rescanned(self, psi_gen, temp_projects_dir):
+        """Test adding a file invalidates the cached listing of its directory."""
+        project_name = "test_listing_change"
+        project_path = os.path.join(temp_projects_dir, project_name)
+        os.makedirs(project_path)
+        with open(os.path.join(project_path, "old.py"), "w") as f:
+            f.write("# Old")
+        os.utime(project_path, (0, 0))
+
+        psi_gen.generate_psi(project_name, use_cache=False)
+        with open(os.path.join(project_path, "new.py"), "w") as f:
+            f.write("# New")
+        psi = psi_gen.generate_psi(project_name, use_cache=False)
+
+        assert "old.py" in psi
+        assert "new.py" in psi
+
+    def test_removed_directories_are_pruned(self, psi_gen, temp_projects_dir):
+        """Test listings of deleted subdirectories are dropped on rescan."""
+        project_name = "test_listing_prune"
+        project_path = os.path.join(temp_projects_dir, project_name)
+        for i in range(50):
+            sub = os.path.join(project_path, f"pkg{i}", "inner")
+            os.makedirs(sub)
+            os.utime(sub, (0, 0))
+            os.utime(os.path.dirname(sub), (0, 0))
+        os.utime(project_path, (0, 0))
+
+        psi_gen.generate_psi(project_name, use_cache=False)
+        assert len(psi_gen._listings[project_name]) == 101
+
+        for i in range(50):
+            shutil.rmtree(os.path.join(project_path, f"pkg{i}"))
+        psi = psi_gen.generate_psi(project_name, use_cache=False)
+
+        assert "pkg0" not in psi
+        assert list(psi_gen._listings[project_name]) == [project_path]
+
+    def test_failed_generation_keeps_no_listings(self, psi_gen, temp_projects_dir):
+        """Test a project whose walk fails leaves no listings behind."""
+        from Core.exceptions.errors import ProjectError
+        project_name = "test_listing_failure"
+        os.makedirs(os.path.join(temp_projects_dir, project_name, "src"))
+
+        with patch("os.scandir", side_effect=PermissionError("denied")):
+            with pytest.raises(ProjectError):
+                psi_gen.generate_psi(project_name, use_cache=False)
+
+        assert project_name not in psi_gen._listings
+        assert project_name not in psi_gen._cache
+
+    def test_psi_truncates_large_projects(self, psi_gen, temp_projects_dir, monkeypatch):
+        """Test PSI output is summarized once the file limit is exceeded."""
+        import sys
+        monkeypatch.setattr(sys.modules["Core.utils.psi_generator"], "PSI_MAX_FILES", 3)
+        project_name = "test_truncate"
+        project_path = os.path.join(temp_projects_dir, project_name)
+        os.makedirs(project_path)
+        for i in range(6):
+            with open(os.path.join(project_path, f"file{i}.py"), "w") as f:
+                f.write("# File")
+
+        psi = psi_gen.generate_psi(project_name, use_cache=False)
+
+        assert psi.endswith("  file3.py\n  ... (1 more files)\n\nSummary: 0 directories, 4+ files")
+        assert "file4.py" not in psi
+
+    def test_directories_listed_in_sorted_order(self, psi_gen, temp_projects_dir):
+        """Test subdirectories appear in a deterministic (sorted) order."""
+        project_name = "test_sorted_dirs"
+        project_path = os.path.join(temp_projects_dir, project_name)
+        for name in ("zeta", "alpha", "mid"):
+            os.makedirs(os.path.join(project_path, name))
+
+        psi = psi_gen.generate_psi(project_name, use_cache=False)
+
+        assert psi.index("alpha/") < psi.index("mid/") < psi.index("zeta/")
+
 
 class TestPSIGeneratorEdgeCases:
     """Tests for edge cases and error handling."""
@@ -290,4 +417,4 @@ class TestPSIGeneratorEdgeCases:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    raise SystemExit(pytest.main([__file__, "-v"]))
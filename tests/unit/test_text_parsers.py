@@ -2,15 +2,28 @@
 Unit tests for Core.utils.text_parsers module.
 Tests JSON extraction, code extraction, and validation functions.
 """
+import json
+
 import pytest
 from Core.utils.text_parsers import (
     extract_json,
     extract_code,
+    extract_code_blocks,
+    CODE_BLOCK_PATTERN,
+    extract_file_paths,
     validate_python_syntax,
-    clean_response
+    clean_response,
+    _check_syntax
 )
 
 
+@pytest.fixture(scope="module")
+def large_json_text():
+    """100-element JSON list embedded in text, built once per module."""
+    data = [{"id": i, "value": f"item_{i}"} for i in range(100)]
+    return f"Result: {json.dumps(data)}", data
+
+
 class TestExtractJson:
     """Tests for extract_json function."""
 
@@ -42,6 +55,12 @@ class TestExtractJson:
         result = extract_json(text)
         assert result == [{"key": [1, 2, 3]}]
 
+    def test_extract_json_bracket_inside_string(self):
+        """Test that brackets inside JSON strings do not end the list early."""
+        text = 'Plan: [{"path": "a]b.py"}, {"path": "[c].py"}] done'
+        result = extract_json(text)
+        assert result == [{"path": "a]b.py"}, {"path": "[c].py"}]
+
     def test_extract_json_not_found(self):
         """Test when no JSON list is present."""
         text = "This is just plain text with no JSON"
@@ -121,6 +140,13 @@ class TestExtractCode:
         # Should only get first block
         assert "Block 2" not in result
 
+    def test_extract_code_skips_comment_only_block(self):
+        """Test that a comment-only block is skipped for the next one."""
+        text = "```python\n# plan only\n```\n\n```python\nx = 1\n```"
+        result = extract_code(text)
+        assert "x = 1" in result
+        assert "plan only" not in result
+
     def test_extract_code_no_code_block(self):
         """Test when no code block is present."""
         text = "This is just plain text"
@@ -154,7 +180,23 @@ class TestExtractCode:
         ```
         '''
         result = extract_code(text)
-        assert result.count('\n\n') >= 1
+        assert '\n\n' in result
+
+
+class TestExtractCodeBlocks:
+    """Tests for extract_code_blocks function."""
+
+    @pytest.mark.parametrize("text", [
+        "```python\nx = 1\n```",
+        "a```python   \n\n  y = 2``` b ```c```",
+        "```\n```",
+        "```py\nz = 3```",
+        "```python\nunterminated",
+        "no fences at all",
+    ])
+    def test_matches_code_block_pattern(self, text):
+        """Test that the substring scanner finds the same blocks as the regex."""
+        assert extract_code_blocks(text) == CODE_BLOCK_PATTERN.findall(text)
 
 
 class TestValidatePythonSyntax:
@@ -227,6 +269,15 @@ print("bad indent")
         assert is_valid is False
         assert error is not None
 
+    def test_repeated_validation_reuses_result(self):
+        """Test that identical sources are compiled once."""
+        code = "def repeated(:\n    pass"
+        first = validate_python_syntax(code)
+        hits = _check_syntax.cache_info().hits
+        assert validate_python_syntax(code) == first
+        assert first[0] is False
+        assert _check_syntax.cache_info().hits == hits + 1
+
 
 class TestCleanResponse:
     """Tests for clean_response function."""
@@ -269,6 +320,26 @@ class TestCleanResponse:
         assert "```python" in result
         # Structure should be maintained
 
+    def test_clean_truncates_at_system_markers(self):
+        """Test that text from the first system marker onwards is dropped."""
+        text = "  Answer text  \nUSER: follow-up\n[END] trailer"
+        assert clean_response(text) == "Answer text"
+        assert clean_response(text, remove_system_prompts=False) == text.strip()
+
+
+class TestExtractFilePaths:
+    """Tests for extract_file_paths function."""
+
+    def test_extract_file_paths(self):
+        """Test extraction of paths separated by whitespace and punctuation."""
+        text = "Create src/main.py, tests/test_main.py; and README.md\nthen src/main.py"
+        result = extract_file_paths(text)
+        assert sorted(result) == ['README.md', 'src/main.py', 'tests/test_main.py']
+
+    def test_extract_file_paths_none(self):
+        """Test text without file paths."""
+        assert extract_file_paths("no paths here") == []
+
 
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
@@ -298,16 +369,15 @@ class TestEdgeCases:
         is_valid, error = validate_python_syntax(code)
         assert is_valid is True
 
-    def test_large_json_extraction(self):
+    def test_large_json_extraction(self, large_json_text):
         """Test extraction of large JSON structure."""
-        large_list = [{"id": i, "value": f"item_{i}"} for i in range(100)]
-        import json
-        text = f"Result: {json.dumps(large_list)}"
+        text, expected = large_json_text
         result = extract_json(text)
         assert len(result) == 100
         assert result[0]["id"] == 0
         assert result[99]["id"] == 99
+        assert result == expected
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    raise SystemExit(pytest.main([__file__, "-v"]))
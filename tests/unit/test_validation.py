@@ -11,8 +11,10 @@ from Core.utils.validation import (
     validate_task_description,
     validate_project_name,
     validate_agent_context,
-    validate_file_path
+    validate_file_path,
+    _ARCH_VALID_ACTIONS
 )
+from Core.utils.text_parsers import _check_syntax, validate_python_syntax
 
 
 class TestValidationResult:
@@ -50,6 +52,22 @@ class TestValidationResult:
         assert "Errors" in summary
         assert "Warnings" in summary
 
+    def test_slots_no_instance_dict(self):
+        """Test results use __slots__ and reject unknown attributes."""
+        result = ValidationResult(True)
+        assert not hasattr(result, '__dict__')
+        with pytest.raises(AttributeError):
+            result.extra = "value"
+
+    def test_has_error_and_warning_ignore_case(self):
+        """Test keyword lookups are case-insensitive and kept separate."""
+        result = ValidationResult(False, errors=["Missing PATH"], warnings=["Vague task"])
+        assert result.has_error("path")
+        assert result.has_error("MISSING")
+        assert not result.has_error("vague")
+        assert result.has_warning("VAGUE")
+        assert not result.has_warning("missing")
+
 
 class TestValidateArchitectOutput:
     """Tests for validate_architect_output function."""
@@ -77,14 +95,14 @@ class TestValidateArchitectOutput:
         """Test with non-list input."""
         result = validate_architect_output("not a list")
         assert result.valid is False
-        assert any("list" in e.lower() for e in result.errors)
+        assert result.has_error("list")
 
     def test_missing_required_fields(self):
         """Test with missing required fields."""
         file_list = [{"path": "main.py"}]  # Missing type and action
         result = validate_architect_output(file_list)
         assert result.valid is False
-        assert any("missing" in e.lower() for e in result.errors)
+        assert result.has_error("missing")
 
     def test_invalid_action(self):
         """Test with invalid action."""
@@ -95,7 +113,27 @@ class TestValidateArchitectOutput:
         }]
         result = validate_architect_output(file_list)
         assert result.valid is False
-        assert any("action" in e.lower() for e in result.errors)
+        assert result.has_error("action")
+
+    @pytest.mark.parametrize("action", sorted(_ARCH_VALID_ACTIONS))
+    def test_each_valid_action_accepted(self, action):
+        """Test every action in the accepted set validates cleanly."""
+        file_list = [{"path": "main.py", "type": "python", "action": action}]
+        result = validate_architect_output(file_list)
+        assert result.valid is True
+        assert result.errors == []
+
+    def test_unhashable_action(self):
+        """Test non-string action is reported instead of raising."""
+        file_list = [{"path": "main.py", "type": "python", "action": ["create"]}]
+        result = validate_architect_output(file_list)
+        assert result.valid is False
+        assert result.has_error("action")
+
+    def test_missing_fields_listed_in_order(self):
+        """Test missing field names are reported deterministically."""
+        result = validate_architect_output([{"path": "main.py"}])
+        assert "Missing required fields: action, type" in result.errors[0]
 
     def test_unsafe_path_with_dotdot(self):
         """Test path with .. generates warning."""
@@ -136,13 +174,13 @@ class TestValidatePlannerOutput:
         """Test with empty plan."""
         result = validate_planner_output("")
         assert result.valid is False
-        assert any("empty" in e.lower() for e in result.errors)
+        assert result.has_error("empty")
 
     def test_not_a_string(self):
         """Test with non-string input."""
         result = validate_planner_output(["list", "of", "items"])
         assert result.valid is False
-        assert any("string" in e.lower() for e in result.errors)
+        assert result.has_error("string")
 
     def test_very_short_plan(self):
         """Test short plan generates warning."""
@@ -176,7 +214,7 @@ if __name__ == "__main__":
         """Test with empty code."""
         result = validate_developer_output("")
         assert result.valid is False
-        assert any("empty" in e.lower() for e in result.errors)
+        assert result.has_error("empty")
 
     def test_not_a_string(self):
         """Test with non-string input."""
@@ -203,6 +241,39 @@ if __name__ == "__main__":
         assert result.valid is True
         # May have warning
 
+    def test_missing_indentation_after_block(self):
+        """Test unindented line after a block opener is reported on the right line."""
+        code = "import os\n\ndef main():\nreturn os.getcwd()\n"
+        result = validate_developer_output(code, "main.py")
+        assert any(w.startswith("Line 4:") for w in result.warnings)
+
+    def test_indented_block_has_no_indentation_warning(self):
+        """Test properly indented code produces no indentation warning."""
+        code = "import os\n\ndef main():\n    return os.getcwd()\n"
+        result = validate_developer_output(code, "main.py")
+        assert not result.has_warning("indent")
+
+    def test_syntax_error_warning(self):
+        """Test syntax errors in Python output are reported with their line."""
+        code = "import os\n\nvalue = (1 +\n"
+        result = validate_developer_output(code, "main.py")
+        assert any(w.startswith("Line ") for w in result.warnings)
+
+    def test_syntax_check_shared_with_validate_python_syntax(self):
+        """Test code checked here is not compiled again by validate_python_syntax."""
+        code = "import os\n\ndef shared():\nreturn 1\n"
+        validate_developer_output(code, "main.py")
+        hits = _check_syntax.cache_info().hits
+        is_valid, error = validate_python_syntax(code)
+        assert is_valid is False
+        assert error.startswith("Syntax error at line 4:")
+        assert _check_syntax.cache_info().hits == hits + 1
+
+    def test_non_python_file_not_parsed(self):
+        """Test non-Python output is not checked for Python syntax."""
+        result = validate_developer_output("<html><body></body></html>", "index.html")
+        assert result.warnings == []
+
 
 class TestValidateTaskDescription:
     """Tests for validate_task_description function."""
@@ -216,7 +287,7 @@ class TestValidateTaskDescription:
         """Test with empty task."""
         result = validate_task_description("")
         assert result.valid is False
-        assert any("empty" in e.lower() for e in result.errors)
+        assert result.has_error("empty")
 
     def test_short_task(self):
         """Test short task generates warning."""
@@ -239,59 +310,72 @@ class TestValidateTaskDescription:
         """Test vague language generates warning."""
         result = validate_task_description("Create something that does stuff")
         assert len(result.warnings) > 0
-        assert any("vague" in w.lower() for w in result.warnings)
+        assert result.has_warning("vague")
 
+    def test_vague_language_case_insensitive(self):
+        """Test vague terms are detected regardless of case."""
+        result = validate_task_description("Maybe build a calculator application")
+        assert any("maybe" in w for w in result.warnings)
 
-class TestValidateProjectName:
-    """Tests for validate_project_name function."""
+    def test_vague_language_whole_words_only(self):
+        """Test vague terms only match whole words."""
+        result = validate_task_description("Create something for the things list")
+        vague = [w for w in result.warnings if "vague" in w.lower()]
+        assert len(vague) == 1
+        assert "something" in vague[0]
+        assert ", thing" not in vague[0]
 
-    def test_valid_project_name(self):
-        """Test with valid project name."""
-        result = validate_project_name("my_calculator")
-        assert result.valid is True
 
-    def test_valid_with_hyphens(self):
-        """Test valid name with hyphens."""
-        result = validate_project_name("my-calculator-app")
-        assert result.valid is True
+class TestValidateProjectName:
+    """Tests for validate_project_name function."""
 
-    def test_empty_name(self):
-        """Test with empty name."""
-        result = validate_project_name("")
-        assert result.valid is False
+    @pytest.mark.parametrize("name, valid, has_warnings", [
+        ("my_calculator", True, False),
+        ("my-calculator-app", True, False),
+        ("", False, False),
+        ("my project!", False, False),
+        ("my project", False, False),
+        ("123project", True, True),       # starts with a number
+        ("ab", True, True),               # very short
+        ("a" * 60, True, True),           # very long
+        ("my_project-name", True, True),  # mixed separators
+        ("café", False, False),           # identifier, but not ASCII
+        ("_private", True, False),
+    ])
+    def test_project_name(self, name, valid, has_warnings):
+        """Test validity and warnings across representative names."""
+        result = validate_project_name(name)
+        assert result.valid is valid
+        assert bool(result.warnings) is has_warnings
 
     def test_invalid_characters(self):
         """Test with invalid characters."""
         result = validate_project_name("my project!")
-        assert result.valid is False
-        assert any("invalid" in e.lower() for e in result.errors)
+        assert result.has_error("invalid")
 
     def test_spaces_in_name(self):
         """Test spaces in name."""
         result = validate_project_name("my project")
+        assert result.has_error("space")
+
+    def test_repeated_calls_return_independent_results(self):
+        """Test repeated calls do not share mutable result lists."""
+        first = validate_project_name("ab")
+        first.warnings.append("mutated")
+        second = validate_project_name("ab")
+        assert "mutated" not in second.warnings
+        assert second.warnings == first.warnings[:-1]
+
+    def test_non_string_name(self):
+        """Test non-string input is rejected without raising."""
+        result = validate_project_name(["my", "project"])
         assert result.valid is False
-        assert any("space" in e.lower() for e in result.errors)
-
-    def test_starts_with_number(self):
-        """Test name starting with number."""
-        result = validate_project_name("123project")
-        # Valid but should have warning
-        assert len(result.warnings) > 0
-
-    def test_very_short_name(self):
-        """Test very short name."""
-        result = validate_project_name("ab")
-        assert len(result.warnings) > 0
-
-    def test_very_long_name(self):
-        """Test very long name."""
-        result = validate_project_name("a" * 60)
-        assert len(result.warnings) > 0
+        assert result.has_error("string")
 
-    def test_mixed_separators(self):
-        """Test mixed hyphens and underscores."""
-        result = validate_project_name("my_project-name")
-        assert len(result.warnings) > 0
+    def test_trailing_newline_rejected(self):
+        """Test that a trailing newline is not accepted as a valid name."""
+        result = validate_project_name("my_project\n")
+        assert result.valid is False
 
 
 class TestValidateAgentContext:
@@ -308,7 +392,7 @@ class TestValidateAgentContext:
         context = {"task": "test"}
         result = validate_agent_context(context, ["task", "psi"])
         assert result.valid is False
-        assert any("missing" in e.lower() for e in result.errors)
+        assert result.has_error("missing")
 
     def test_not_a_dict(self):
         """Test with non-dict input."""
@@ -320,7 +404,7 @@ class TestValidateAgentContext:
         context = {"task": None}
         result = validate_agent_context(context, ["task"])
         assert result.valid is False
-        assert any("none" in e.lower() for e in result.errors)
+        assert result.has_error("none")
 
     def test_empty_string_values(self):
         """Test with empty string values."""
@@ -332,38 +416,42 @@ class TestValidateAgentContext:
 class TestValidateFilePath:
     """Tests for validate_file_path function."""
 
-    def test_valid_relative_path(self):
-        """Test with valid relative path."""
-        result = validate_file_path("src/main.py")
-        assert result.valid is True
-
-    def test_empty_path(self):
-        """Test with empty path."""
-        result = validate_file_path("")
-        assert result.valid is False
+    @pytest.mark.parametrize("path, valid, has_warnings", [
+        ("src/main.py", True, False),
+        ("", False, False),
+        ("../dangerous.py", False, False),    # traversal attempt
+        ("/absolute/path.py", False, False),
+        ("file<name>.py", False, False),
+        ("README", True, True),               # no extension
+    ])
+    def test_file_path(self, path, valid, has_warnings):
+        """Test validity and warnings across representative paths."""
+        result = validate_file_path(path)
+        assert result.valid is valid
+        assert bool(result.warnings) is has_warnings
 
     def test_path_traversal(self):
         """Test path with .. (traversal attempt)."""
         result = validate_file_path("../dangerous.py")
-        assert result.valid is False
-        assert any("security" in e.lower() for e in result.errors)
+        assert result.has_error("security")
 
-    def test_absolute_path(self):
-        """Test absolute path generates error."""
-        result = validate_file_path("/absolute/path.py")
-        assert result.valid is False
-        assert len(result.errors) > 0
+    def test_invalid_characters_listed(self):
+        """Test that each offending character is reported once, sorted."""
+        result = validate_file_path("a<b>c<d.py")
+        assert any(e.endswith("invalid characters: <, >") for e in result.errors)
 
-    def test_invalid_characters(self):
-        """Test path with invalid characters."""
-        result = validate_file_path("file<name>.py")
-        assert result.valid is False
+    def test_no_extension_in_dotted_directory(self):
+        """Test a dot in a parent directory does not count as an extension."""
+        result = validate_file_path("src.d/Makefile")
+        assert result.has_warning("extension")
 
-    def test_no_extension(self):
-        """Test file without extension."""
-        result = validate_file_path("README")
-        assert len(result.warnings) > 0
+    def test_extension_with_backslash_separator(self):
+        """Test Windows-style separators are handled when finding the file name."""
+        result = validate_file_path("src\\main.py")
+        assert not result.has_warning("extension")
+        result = validate_file_path("src.d\\Makefile")
+        assert result.has_warning("extension")
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    raise SystemExit(pytest.main([__file__, "-v"]))